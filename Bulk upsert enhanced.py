@@ -1,15 +1,41 @@
 import os
+import csv
 import logging
+import logging.handlers
+import queue
+import atexit
 import json
 import time
+import itertools
+import threading
+import uuid
+import collections
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import pyodbc
 from dotenv import load_dotenv
 from datetime import datetime
-from typing import Optional, Tuple, List
-from contextlib import contextmanager
+from typing import Optional, Tuple, List, Iterator
+from contextlib import contextmanager, ExitStack
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+try:
+    # Optional: SqlBulkCopy via Apache Arrow (pip install arrowsqlbcpy)
+    from arrowsqlbcpy import bulkcopy_from_pandas
+except ImportError:
+    bulkcopy_from_pandas = None
+
+try:
+    # Optional: faster JSON serialization for structured logs (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
 # -----------------------------------
 # 1. Configuration
 # -----------------------------------
@@ -38,8 +64,39 @@ REQUIRED_COLUMNS = [
     "SheetsName"
 ]
 
+# In-memory dtype for every column: Arrow-backed nullable strings (offset buffers
+# instead of Python objects; .str/.isna dispatch to Arrow's C++ kernels)
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+# NVARCHAR widths of the staging/target columns
+COLUMN_MAX_LENGTHS = {col: 255 for col in EXPECTED_COLUMNS}
+COLUMN_MAX_LENGTHS["Tagging required?"] = 50
+
+# Tag Sub Type ID format: alphanumeric, dash, underscore only (RE2 syntax for
+# Arrow's regex kernel; `$` only matches at the very end, so a trailing newline fails)
+TAG_SUB_TYPE_ID_PATTERN = r'^[A-Za-z0-9_-]+$'
+
+# Accepted values for "Tagging required?" (compared after trimming whitespace)
+VALID_TAGGING_VALUES = ['Yes', 'No', 'Y', 'N', None, '']
+VALID_TAGGING_VALUE_SET = pa.array([v for v in VALID_TAGGING_VALUES if v is not None])
+
+# Global temp table so the bulk copy session can see it. Global temp tables are
+# server-wide, so the suffix is unique per run (not per host) to keep concurrent
+# runs from different machines/containers from colliding
+STAGING_TABLE = f"##ClassSheetsMapping_Staging_{uuid.uuid4().hex}"
+
 # Performance settings
 BATCH_SIZE = 1000
+CSV_BLOCK_SIZE = 8 << 20  # bytes of CSV parsed, validated and loaded per chunk
+# Cell values read as NULL; the same set pd.read_csv treats as NA by default
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null"
+]
+LOAD_METHODS = ["bulkcopy", "executemany", "tvp"]
+LOAD_METHOD = "bulkcopy"  # falls back to executemany if arrowsqlbcpy is missing
+INSERT_WORKERS = 4  # parallel connections used by the executemany load method
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2  # seconds
 
@@ -74,12 +131,40 @@ class StructuredLogger:
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(log_format)
         
+        # File writes happen on a background thread, buffered in batches, so the
+        # insert loop only enqueues records (ERROR records flush immediately)
+        buffered_handler = logging.handlers.MemoryHandler(1024, target=file_handler)
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        self.listener = logging.handlers.QueueListener(
+            log_queue, buffered_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        
+        # atexit runs these in reverse: drain the queue, flush the buffer, then
+        # close the log file (MemoryHandler.close only drops its target)
+        atexit.register(file_handler.close)
+        atexit.register(buffered_handler.close)
+        atexit.register(self.listener.stop)
+        
         self.logger.setLevel(logging.DEBUG)
         self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(queue_handler)
     
     def log_operation(self, operation: str, status: str, **kwargs):
-        """Log structured operation data"""
+        """Log structured operation data as a single-line JSON record"""
+        if status == 'error':
+            level = logging.ERROR
+        elif status == 'warning':
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        
+        # Skip building and serializing the record if it would be filtered out
+        if not self.logger.isEnabledFor(level):
+            return
+        
         log_data = {
             'operation': operation,
             'status': status,
@@ -87,12 +172,14 @@ class StructuredLogger:
             **kwargs
         }
         
-        if status == 'error':
-            self.logger.error(json.dumps(log_data, indent=2))
-        elif status == 'warning':
-            self.logger.warning(json.dumps(log_data, indent=2))
+        if orjson is not None:
+            message = orjson.dumps(
+                log_data, default=str, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
         else:
-            self.logger.info(json.dumps(log_data, indent=2))
+            message = json.dumps(log_data, default=str, separators=(',', ':'))
+        
+        self.logger.log(level, message)
     
     def info(self, message: str):
         self.logger.info(message)
@@ -141,20 +228,36 @@ def validate_file_exists(path: str):
 # -----------------------------------
 load_dotenv()
 
+# Connection strings are built once on first use (after validate_environment)
+# and reused by every connection, including the parallel insert workers
+@lru_cache(maxsize=None)
+def get_odbc_connection_string() -> str:
+    """Build the ODBC connection string used by pyodbc"""
+    return (
+        f"DRIVER={{{os.getenv('DB_DRIVER')}}};"
+        f"SERVER={os.getenv('DB_SERVER')};"
+        f"DATABASE={os.getenv('DB_NAME')};"
+        f"UID={os.getenv('DB_USER')};"
+        f"PWD={os.getenv('DB_PASSWORD')}"
+    )
+
+@lru_cache(maxsize=None)
+def get_bulkcopy_connection_string() -> str:
+    """Build the SqlClient connection string used by SqlBulkCopy"""
+    return (
+        f"Server={os.getenv('DB_SERVER')};"
+        f"Database={os.getenv('DB_NAME')};"
+        f"User Id={os.getenv('DB_USER')};"
+        f"Password={os.getenv('DB_PASSWORD')};"
+    )
+
 @contextmanager
 def get_db_connection():
     """Context manager for database connections with automatic cleanup"""
     conn = None
     try:
         logger.info("Establishing database connection...")
-        conn = pyodbc.connect(
-            f"DRIVER={{{os.getenv('DB_DRIVER')}}};"
-            f"SERVER={os.getenv('DB_SERVER')};"
-            f"DATABASE={os.getenv('DB_NAME')};"
-            f"UID={os.getenv('DB_USER')};"
-            f"PWD={os.getenv('DB_PASSWORD')}",
-            autocommit=False
-        )
+        conn = pyodbc.connect(get_odbc_connection_string(), autocommit=False)
         logger.info("✓ Database connection established")
         yield conn
         
@@ -166,16 +269,21 @@ def get_db_connection():
             conn.close()
             logger.info("Database connection closed")
 
-def execute_with_retry(func, operation_name: str, max_retries: int = MAX_RETRIES):
-    """Execute database operation with retry logic for transient failures"""
+def execute_with_retry(func, operation_name: str, max_retries: int = MAX_RETRIES,
+                       log_success: bool = True):
+    """
+    Execute database operation with retry logic for transient failures
+    Set log_success=False for hot loops; retries and failures are always logged
+    """
     for attempt in range(max_retries):
         try:
             result = func()
-            logger.log_operation(
-                operation_name,
-                'success',
-                attempt=attempt + 1
-            )
+            if log_success or attempt > 0:
+                logger.log_operation(
+                    operation_name,
+                    'success',
+                    attempt=attempt + 1
+                )
             return result
             
         except pyodbc.OperationalError as e:
@@ -198,9 +306,52 @@ def execute_with_retry(func, operation_name: str, max_retries: int = MAX_RETRIES
 # -----------------------------------
 # 5. Data Validation
 # -----------------------------------
+def _invalid_id_mask(values) -> np.ndarray:
+    """
+    Check Tag Sub Type IDs against TAG_SUB_TYPE_ID_PATTERN with Arrow's RE2 kernel
+    Returns: numpy mask of non-NULL values that don't match (empty strings included)
+    """
+    # NULL IDs are reported by the required-field check
+    matches = pc.match_substring_regex(values, TAG_SUB_TYPE_ID_PATTERN)
+    return pc.invert(matches.fill_null(True)).to_numpy(zero_copy_only=False)
+
+def _scan_column(values, col: str) -> dict:
+    """
+    Run every per-column check on one column's Arrow string array back to back,
+    so each column is swept once while it is hot in cache
+    Returns: dict of numpy masks for the checks that apply to `col`
+    """
+    scan = {'nulls': pc.is_null(values).to_numpy(zero_copy_only=False)}
+    
+    if col not in NULLABLE_COLUMNS:
+        too_long = pc.greater(pc.utf8_length(values), 255).fill_null(False)
+        scan['too_long'] = too_long.to_numpy(zero_copy_only=False)
+    
+    if col == 'Tag Sub Type ID':
+        scan['invalid'] = _invalid_id_mask(values)
+    
+    if col == 'Tagging required?':
+        # One hash lookup per raw value; only the (rare) misses are trimmed and
+        # looked up again, so the whole column is never copied by a trim
+        valid = pc.is_in(values, value_set=VALID_TAGGING_VALUE_SET)
+        invalid = pc.and_(pc.is_valid(values), pc.invert(valid)).to_numpy(zero_copy_only=False)
+        
+        if invalid.any():
+            candidates = np.flatnonzero(invalid)
+            trimmed = pc.utf8_trim_whitespace(values.take(pa.array(candidates)))
+            invalid = invalid.copy()
+            invalid[candidates] = ~pc.is_in(
+                trimmed, value_set=VALID_TAGGING_VALUE_SET
+            ).to_numpy(zero_copy_only=False)
+        
+        scan['invalid'] = invalid
+    
+    return scan
+
 def validate_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     """
     Comprehensive data validation
+    Expects empty/whitespace-only cells already normalized to NULL (see load_csv)
     Returns: (cleaned_dataframe, list_of_errors)
     """
     errors = []
@@ -208,64 +359,78 @@ def validate_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     
     logger.info(f"Validating {original_count} records...")
     
+    values = {col: pa.array(df[col].astype(STRING_DTYPE)) for col in df.columns}
+    
     # 1. Check for duplicate Tag Sub Type IDs
-    duplicates = df[df.duplicated(subset=['Tag Sub Type ID'], keep=False)]
-    if not duplicates.empty:
-        dupe_ids = duplicates['Tag Sub Type ID'].unique().tolist()
+    # (single Arrow hash reduction, filtered in Arrow so only the duplicated IDs
+    # reach Python; NULL IDs are reported by the required-field check)
+    id_counts = pc.value_counts(values['Tag Sub Type ID'])
+    dupe_ids = pc.filter(
+        id_counts.field('values'), pc.greater(id_counts.field('counts'), 1)
+    ).drop_null().to_pylist()
+    if dupe_ids:
         errors.append(f"Duplicate Tag Sub Type IDs found: {dupe_ids}")
         logger.warning(f"Found {len(dupe_ids)} duplicate IDs")
     
+    # 2-5. One fused scan per column. Each mask is reduced with .any() once;
+    # only the failing ones are kept, so a clean frame skips straight to the
+    # summary and rows/examples are only materialized for checks that failed.
+    scans = {col: _scan_column(values[col], col) for col in df.columns}
+    failed = {
+        (col, check): mask
+        for col, scan in scans.items()
+        for check, mask in scan.items()
+        if (check != 'nulls' or col in REQUIRED_COLUMNS) and mask.any()
+    }
+    invalid_rows = int(np.logical_or.reduce(list(failed.values())).sum()) if failed else 0
+    
     # 2. Validate required fields are not null
+    # (load_csv has already turned empty/whitespace-only cells into NULLs)
     for col in REQUIRED_COLUMNS:
-        null_mask = df[col].isna() | (df[col].astype(str).str.strip() == '')
-        null_rows = df[null_mask]
-        
-        if not null_rows.empty:
-            null_indices = null_rows.index.tolist()
+        null_mask = failed.get((col, 'nulls'))
+        if null_mask is not None:
+            null_count = int(null_mask.sum())
+            null_indices = df.index[null_mask][:10].tolist()
             errors.append(
-                f"Required column '{col}' has {len(null_rows)} NULL/empty values "
-                f"at rows: {null_indices[:10]}{'...' if len(null_indices) > 10 else ''}"
+                f"Required column '{col}' has {null_count} NULL/empty values "
+                f"at rows: {null_indices}{'...' if null_count > 10 else ''}"
             )
     
     # 3. Validate Tag Sub Type ID format (alphanumeric, dash, underscore only)
-    invalid_ids = df[~df['Tag Sub Type ID'].astype(str).str.match(r'^[A-Za-z0-9_-]+$')]
-    if not invalid_ids.empty:
-        invalid_examples = invalid_ids['Tag Sub Type ID'].head(5).tolist()
+    invalid_id_mask = failed.get(('Tag Sub Type ID', 'invalid'))
+    if invalid_id_mask is not None:
+        invalid_examples = df.loc[invalid_id_mask, 'Tag Sub Type ID'].head(5).tolist()
         errors.append(
             f"Invalid characters in Tag Sub Type ID. "
             f"Examples: {invalid_examples}"
         )
     
     # 4. Check for unexpected data types or formats
-    for col in df.columns:
-        if col not in NULLABLE_COLUMNS:
-            # Check for extremely long values (potential data corruption)
-            long_values = df[df[col].astype(str).str.len() > 255]
-            if not long_values.empty:
-                errors.append(
-                    f"Column '{col}' has {len(long_values)} values exceeding 255 characters"
-                )
-    
-    # 5. Validate specific column values if applicable
-    if 'Tagging required?' in df.columns:
-        valid_values = ['Yes', 'No', 'Y', 'N', None, '']
-        invalid_tagging = df[
-            df['Tagging required?'].notna() & 
-            ~df['Tagging required?'].astype(str).str.strip().isin(valid_values)
-        ]
-        if not invalid_tagging.empty:
-            invalid_examples = invalid_tagging['Tagging required?'].unique().tolist()
+    # Check for extremely long values (potential data corruption)
+    for col in scans:
+        too_long_mask = failed.get((col, 'too_long'))
+        if too_long_mask is not None:
             errors.append(
-                f"'Tagging required?' has invalid values. "
-                f"Expected: {valid_values}. Found: {invalid_examples}"
+                f"Column '{col}' has {int(too_long_mask.sum())} values "
+                f"exceeding 255 characters"
             )
     
+    # 5. Validate specific column values if applicable
+    invalid_tagging_mask = failed.get(('Tagging required?', 'invalid'))
+    if invalid_tagging_mask is not None:
+        invalid_examples = df.loc[invalid_tagging_mask, 'Tagging required?'].unique().tolist()
+        errors.append(
+            f"'Tagging required?' has invalid values. "
+            f"Expected: {VALID_TAGGING_VALUES}. Found: {invalid_examples}"
+        )
+    
     # Log validation summary
     if errors:
         logger.log_operation(
             'data_validation',
             'warning',
             total_records=original_count,
+            invalid_rows=invalid_rows,
             error_count=len(errors),
             errors=errors
         )
@@ -282,70 +447,205 @@ def validate_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
 # -----------------------------------
 # 6. Read & Process CSV
 # -----------------------------------
-def load_csv(path: str, validate: bool = True) -> pd.DataFrame:
-    """Load and validate CSV file"""
+def _validate_chunk(df: pd.DataFrame, seen_ids: set) -> List[str]:
+    """Validate one chunk, including duplicate IDs already seen in earlier chunks"""
+    df, validation_errors = validate_data(df)
+    
+    # Convert to Python strings once; the set ops then run without per-element
+    # Arrow scalar boxing
+    chunk_ids = df['Tag Sub Type ID'].dropna().unique().tolist()
+    repeated_ids = sorted(seen_ids.intersection(chunk_ids))
+    if repeated_ids:
+        validation_errors.append(
+            f"Duplicate Tag Sub Type IDs found in earlier chunks: {repeated_ids}"
+        )
+        logger.warning(f"Found {len(repeated_ids)} IDs duplicated across chunks")
+    seen_ids.update(chunk_ids)
+    
+    return validation_errors
+
+def read_csv_header(path: str) -> List[str]:
+    """Read just the header row of the CSV file"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f), None)
+    
+    if not header:
+        raise ValueError("CSV file is empty")
+    
+    return header
+
+def _short_row_handler(header: List[str], short_rows: collections.deque):
+    """
+    Build an Arrow invalid_row_handler that keeps rows with fewer fields than the
+    header (pd.read_csv fills their missing trailing cells with NULL). The parser
+    skips them; they are recorded in file order for _with_short_rows to put back.
+    Rows with too many fields still fail, as they do in pd.read_csv.
+    """
+    positions = [header.index(col) for col in EXPECTED_COLUMNS]
+    null_values = set(CSV_NULL_VALUES)
+    
+    def _handle(row) -> str:
+        if row.actual_columns > row.expected_columns or row.number < 0:
+            return 'error'
+        
+        fields = next(csv.reader([row.text]))
+        fields += [None] * (len(header) - len(fields))
+        values = [None if fields[i] in null_values else fields[i] for i in positions]
+        # row.number counts the header as row 1
+        short_rows.append((row.number - 2, values))
+        return 'skip'
+    
+    return _handle
+
+def _with_short_rows(frames: Iterator[pd.DataFrame],
+                     short_rows: collections.deque) -> Iterator[pd.DataFrame]:
+    """
+    Put the padded short rows back at their file position
+    Every row of a batch has been through the handler by the time the batch is
+    yielded, so each short row lands in the chunk it was read with (rows after
+    the last batch come out as one final chunk)
+    """
+    offset = 0
+    
+    for df in itertools.chain(frames, [None]):
+        placed = []
+        if df is None:
+            placed.extend(short_rows)
+        else:
+            while short_rows and short_rows[0][0] < offset + len(df) + len(placed):
+                placed.append(short_rows.popleft())
+        
+        if placed:
+            padded = pd.DataFrame(
+                [values for _, values in placed], columns=EXPECTED_COLUMNS, dtype=STRING_DTYPE
+            )
+            combined = padded if df is None else pd.concat([df, padded], ignore_index=True)
+            
+            # Target position of each combined row: parsed rows fill the gaps
+            short_positions = np.array([index for index, _ in placed]) - offset
+            parsed_positions = np.setdiff1d(np.arange(len(combined)), short_positions)
+            target = np.concatenate([parsed_positions, short_positions])
+            df = combined.iloc[np.argsort(target)].reset_index(drop=True)
+        
+        if df is None:
+            return
+        
+        offset += len(df)
+        yield df
+
+def load_csv_iter(path: str, validate: bool = True,
+                  block_size: int = CSV_BLOCK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream CSV file in chunks so parsing, validation and loading overlap
+    Yields: cleaned (and optionally validated) DataFrame chunks
+    """
     logger.info(f"Loading CSV file: {path}")
     
     try:
-        # Read CSV with proper encoding
-        df = pd.read_csv(path, encoding="utf-8-sig")
-        logger.info(f"✓ Loaded {len(df)} records from CSV")
-        
         # Check for expected columns
-        missing_cols = set(EXPECTED_COLUMNS) - set(df.columns)
+        header = read_csv_header(path)
+        
+        missing_cols = set(EXPECTED_COLUMNS) - set(header)
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         
-        extra_cols = set(df.columns) - set(EXPECTED_COLUMNS)
+        extra_cols = set(header) - set(EXPECTED_COLUMNS)
         if extra_cols:
             logger.warning(f"Extra columns found (will be ignored): {extra_cols}")
         
-        # Select only expected columns
-        df = df[EXPECTED_COLUMNS].copy()
+        # Multi-threaded Arrow parser; only expected columns are converted, all as
+        # strings (every column is NVARCHAR in the target). The UTF-8 BOM is skipped.
+        # Quoted cells may span lines and short rows are NULL-padded, as with
+        # pd.read_csv.
+        short_rows = collections.deque()
+        reader = pacsv.open_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            parse_options=pacsv.ParseOptions(
+                newlines_in_values=True,
+                invalid_row_handler=_short_row_handler(header, short_rows)
+            ),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=EXPECTED_COLUMNS,
+                column_types={col: pa.string() for col in EXPECTED_COLUMNS},
+                null_values=CSV_NULL_VALUES,
+                strings_can_be_null=True
+            )
+        )
         
-        # Replace empty strings/whitespace with NULL
-        df = df.replace(r'^\s*$', None, regex=True)
+        total_rows = 0
+        chunk_number = 0
+        seen_ids = set()
+        string_types = {pa.string(): STRING_DTYPE, pa.large_string(): STRING_DTYPE}
         
-        # Ensure nullable columns get proper NULLs
-        df[NULLABLE_COLUMNS] = df[NULLABLE_COLUMNS].where(
-            pd.notnull(df[NULLABLE_COLUMNS]), None
-        )
+        # Zero-copy wrap of the Arrow string arrays
+        frames = (batch.to_pandas(types_mapper=string_types.get) for batch in reader)
         
-        # Validate data if requested
-        if validate:
-            df, validation_errors = validate_data(df)
+        for chunk_number, df in enumerate(_with_short_rows(frames, short_rows), start=1):
+            df.index = pd.RangeIndex(total_rows, total_rows + len(df))
             
-            if validation_errors:
-                logger.warning(
-                    f"Data validation found {len(validation_errors)} issue(s). "
-                    f"Review logs for details."
-                )
-                # In production, you might want to decide whether to proceed or abort
-                # For now, we'll log and continue
+            # Replace empty strings/whitespace with NULL (vectorized strip, no regex)
+            for col in EXPECTED_COLUMNS:
+                df[col] = df[col].mask(df[col].str.strip() == '', None)
+            
+            # Validate data if requested
+            if validate:
+                validation_errors = _validate_chunk(df, seen_ids)
+                
+                if validation_errors:
+                    logger.warning(
+                        f"Data validation found {len(validation_errors)} issue(s) "
+                        f"in chunk {chunk_number}. Review logs for details."
+                    )
+                    # In production, you might want to decide whether to proceed or abort
+                    # For now, we'll log and continue
+            
+            total_rows += len(df)
+            logger.debug(f"Loaded chunk {chunk_number}: {len(df)} records")
+            yield df
         
-        return df
+        if chunk_number == 0:
+            # Header-only file: Arrow yields no batches, keep the typed empty frame
+            yield pd.DataFrame({col: pd.Series(dtype=STRING_DTYPE) for col in EXPECTED_COLUMNS})
         
-    except pd.errors.EmptyDataError:
-        raise ValueError("CSV file is empty")
-    except pd.errors.ParserError as e:
+        logger.info(f"✓ Loaded {total_rows} records from CSV")
+        
+    except pa.ArrowInvalid as e:
         raise ValueError(f"CSV parsing error: {e}")
     except Exception as e:
         logger.error(f"Failed to load CSV: {e}", exc_info=True)
         raise
 
+def load_csv(path: str, validate: bool = True) -> pd.DataFrame:
+    """Load and validate the whole CSV file into a single DataFrame"""
+    df = pd.concat(list(load_csv_iter(path, validate=False)))
+    df = df.astype({col: STRING_DTYPE for col in EXPECTED_COLUMNS})
+    
+    # Validate data if requested
+    if validate:
+        df, validation_errors = validate_data(df)
+        
+        if validation_errors:
+            logger.warning(
+                f"Data validation found {len(validation_errors)} issue(s). "
+                f"Review logs for details."
+            )
+    
+    return df
+
 # -----------------------------------
 # 7. Create Staging Table
 # -----------------------------------
 def create_staging_table(cursor):
     """Create temporary staging table with proper indexing"""
-    logger.info("Creating staging table...")
+    logger.info(f"Creating staging table {STAGING_TABLE}...")
     
     def _create():
-        cursor.execute("""
-        IF OBJECT_ID('tempdb..#ClassSheetsMapping_Staging') IS NOT NULL
-            DROP TABLE #ClassSheetsMapping_Staging;
+        cursor.execute(f"""
+        IF OBJECT_ID('tempdb..{STAGING_TABLE}') IS NOT NULL
+            DROP TABLE {STAGING_TABLE};
 
-        CREATE TABLE #ClassSheetsMapping_Staging (
+        CREATE TABLE {STAGING_TABLE} (
             [Tag Sub Type ID] NVARCHAR(255) NOT NULL,
             [Tag Sub Type] NVARCHAR(255),
             [Tag Type] NVARCHAR(255),
@@ -355,8 +655,9 @@ def create_staging_table(cursor):
             [Type Code in TNP] NVARCHAR(255)
         );
 
-        CREATE UNIQUE CLUSTERED INDEX IX_Stage_TagSubTypeID
-            ON #ClassSheetsMapping_Staging ([Tag Sub Type ID]);
+        -- Not unique: duplicate IDs are collapsed by the MERGE source query
+        CREATE CLUSTERED INDEX IX_Stage_TagSubTypeID
+            ON {STAGING_TABLE} ([Tag Sub Type ID]);
         """)
         logger.info("✓ Staging table created successfully")
     
@@ -365,13 +666,17 @@ def create_staging_table(cursor):
 # -----------------------------------
 # 8. Bulk Insert with Batching
 # -----------------------------------
-def bulk_insert(cursor, df: pd.DataFrame):
-    """Bulk insert data into staging table with batching for large datasets"""
+def bulk_insert(cursors: List, df: pd.DataFrame):
+    """
+    Bulk insert data into staging table with batching for large datasets
+    Batches are spread across the given cursors (one connection each) and
+    inserted in parallel; pyodbc releases the GIL while a batch executes
+    """
     total_rows = len(df)
-    logger.info(f"Starting bulk insert of {total_rows} records...")
+    logger.info(f"Starting bulk insert of {total_rows} records on {len(cursors)} connection(s)...")
     
-    insert_sql = """
-    INSERT INTO #ClassSheetsMapping_Staging (
+    insert_sql = f"""
+    INSERT INTO {STAGING_TABLE} (
         [Tag Sub Type ID],
         [Tag Sub Type],
         [Tag Type],
@@ -383,62 +688,155 @@ def bulk_insert(cursor, df: pd.DataFrame):
     VALUES (?, ?, ?, ?, ?, ?, ?)
     """
     
-    cursor.fast_executemany = True
+    for cursor in cursors:
+        cursor.fast_executemany = True
+        
+        # Declare parameter types once so fast_executemany doesn't re-describe them per batch
+        cursor.setinputsizes([
+            (pyodbc.SQL_WVARCHAR, COLUMN_MAX_LENGTHS[col], 0) for col in EXPECTED_COLUMNS
+        ])
+    
+    # Materialize row tuples once and slice per batch
+    rows = _df_to_rows(df)
+    batch_starts = list(range(0, total_rows, BATCH_SIZE))
     
     # Process in batches
-    batches_processed = 0
+    progress_lock = threading.Lock()
+    progress = {'rows': 0, 'batches': 0}
+    # Set when any worker fails so the others stop instead of finishing a load
+    # that is about to be rolled back
+    abort = threading.Event()
     start_time = time.time()
     
-    for i in range(0, total_rows, BATCH_SIZE):
-        batch = df.iloc[i:i + BATCH_SIZE]
+    def _insert_share(worker_index: int):
+        """Insert every len(cursors)-th batch on this worker's cursor"""
+        cursor = cursors[worker_index]
         
-        def _insert_batch():
-            cursor.executemany(insert_sql, batch.values.tolist())
-            return len(batch)
-        
-        rows_inserted = execute_with_retry(
-            _insert_batch,
-            f"bulk_insert_batch_{batches_processed + 1}"
-        )
-        
-        batches_processed += 1
-        progress = min(i + BATCH_SIZE, total_rows)
-        
-        if batches_processed % 10 == 0 or progress == total_rows:
-            elapsed = time.time() - start_time
-            rate = progress / elapsed if elapsed > 0 else 0
-            logger.info(
-                f"Progress: {progress}/{total_rows} rows "
-                f"({100 * progress / total_rows:.1f}%) - "
-                f"{rate:.0f} rows/sec"
-            )
+        for batch_number in range(worker_index, len(batch_starts), len(cursors)):
+            if abort.is_set():
+                return
+            
+            i = batch_starts[batch_number]
+            batch = rows[i:i + BATCH_SIZE]
+            
+            def _insert_batch():
+                cursor.executemany(insert_sql, batch)
+                return len(batch)
+            
+            # Per-batch success records are skipped; progress is logged every 10 batches
+            try:
+                execute_with_retry(
+                    _insert_batch,
+                    f"bulk_insert_batch_{batch_number + 1}",
+                    log_success=False
+                )
+            except Exception:
+                abort.set()
+                raise
+            
+            with progress_lock:
+                progress['rows'] += len(batch)
+                progress['batches'] += 1
+                rows_done = progress['rows']
+                batches_processed = progress['batches']
+            
+            if batches_processed % 10 == 0 or rows_done == total_rows:
+                elapsed = time.time() - start_time
+                rate = rows_done / elapsed if elapsed > 0 else 0
+                logger.info(
+                    f"Progress: {rows_done}/{total_rows} rows "
+                    f"({100 * rows_done / total_rows:.1f}%) - "
+                    f"{rate:.0f} rows/sec"
+                )
+    
+    if len(cursors) == 1:
+        _insert_share(0)
+    else:
+        with ThreadPoolExecutor(max_workers=len(cursors)) as executor:
+            # list() re-raises the first worker failure
+            list(executor.map(_insert_share, range(len(cursors))))
     
     elapsed_time = time.time() - start_time
     logger.log_operation(
         'bulk_insert',
         'success',
         total_rows=total_rows,
-        batches=batches_processed,
+        batches=progress['batches'],
+        connections=len(cursors),
         elapsed_seconds=round(elapsed_time, 2),
         rows_per_second=round(total_rows / elapsed_time, 2)
     )
 
+def bulk_copy(df: pd.DataFrame):
+    """Stream data into staging table with SqlBulkCopy (single TDS bulk load)"""
+    total_rows = len(df)
+    logger.info(f"Starting bulk copy of {total_rows} records...")
+    
+    connection_string = get_bulkcopy_connection_string()
+    start_time = time.time()
+    
+    # Not wrapped in execute_with_retry: the driver never raises
+    # pyodbc.OperationalError, and a partly-copied batch can't be safely replayed
+    bulkcopy_from_pandas(df, connection_string, STAGING_TABLE)
+    
+    elapsed_time = time.time() - start_time
+    logger.log_operation(
+        'bulk_copy',
+        'success',
+        total_rows=total_rows,
+        elapsed_seconds=round(elapsed_time, 2),
+        rows_per_second=round(total_rows / elapsed_time, 2) if elapsed_time > 0 else 0
+    )
+
 # -----------------------------------
 # 9. MERGE (UPSERT) with Statistics
 # -----------------------------------
-def merge_data(cursor) -> dict:
-    """
-    Merge data from staging to target table
-    Returns statistics about the operation
-    """
-    logger.info("Starting MERGE operation...")
-    
-    merge_sql = """
+# Shared by the staging-table MERGE and the TVP stored procedure.
+# Duplicate IDs in the source are collapsed server-side (one arbitrary row per
+# ID; the client-side validation reports them), and matched rows are only
+# updated when a value actually differs (EXCEPT compares NULLs as equal), so
+# unchanged rows generate no log writes. Values are compared as VARBINARY so the
+# check is exact: the column collation would otherwise treat case-only edits and
+# trailing spaces as unchanged.
+MERGE_SQL_TEMPLATE = """
     MERGE dbo.ClassSheetsMapping AS target
-    USING #ClassSheetsMapping_Staging AS source
+    USING (
+        SELECT
+            [Tag Sub Type ID],
+            [Tag Sub Type],
+            [Tag Type],
+            [Tag Category],
+            [SheetsName],
+            [Tagging required?],
+            [Type Code in TNP]
+        FROM (
+            SELECT *,
+                ROW_NUMBER() OVER (
+                    PARTITION BY [Tag Sub Type ID] ORDER BY (SELECT NULL)
+                ) AS rn
+            FROM {source}
+        ) AS ranked
+        WHERE rn = 1
+    ) AS source
         ON target.[Tag Sub Type ID] = source.[Tag Sub Type ID]
 
-    WHEN MATCHED THEN
+    WHEN MATCHED AND EXISTS (
+        SELECT
+            CAST(source.[Tag Sub Type] AS VARBINARY(510)),
+            CAST(source.[Tag Type] AS VARBINARY(510)),
+            CAST(source.[Tag Category] AS VARBINARY(510)),
+            CAST(source.[SheetsName] AS VARBINARY(510)),
+            CAST(source.[Tagging required?] AS VARBINARY(510)),
+            CAST(source.[Type Code in TNP] AS VARBINARY(510))
+        EXCEPT
+        SELECT
+            CAST(target.[Tag Sub Type] AS VARBINARY(510)),
+            CAST(target.[Tag Type] AS VARBINARY(510)),
+            CAST(target.[Tag Category] AS VARBINARY(510)),
+            CAST(target.[SheetsName] AS VARBINARY(510)),
+            CAST(target.[Tagging required?] AS VARBINARY(510)),
+            CAST(target.[Type Code in TNP] AS VARBINARY(510))
+    ) THEN
         UPDATE SET
             target.[Tag Sub Type] = source.[Tag Sub Type],
             target.[Tag Type] = source.[Tag Type],
@@ -469,6 +867,68 @@ def merge_data(cursor) -> dict:
     
     OUTPUT $action AS Action;
     """
+
+CREATE_TVP_TYPE_SQL = """
+    IF TYPE_ID('dbo.ClassSheetsMappingTVP') IS NULL
+        CREATE TYPE dbo.ClassSheetsMappingTVP AS TABLE (
+            [Tag Sub Type ID] NVARCHAR(255) NOT NULL,
+            [Tag Sub Type] NVARCHAR(255),
+            [Tag Type] NVARCHAR(255),
+            [Tag Category] NVARCHAR(255),
+            [SheetsName] NVARCHAR(255),
+            [Tagging required?] NVARCHAR(50),
+            [Type Code in TNP] NVARCHAR(255)
+        );
+    """
+
+CREATE_TVP_PROC_SQL = """
+    CREATE OR ALTER PROCEDURE dbo.UpsertClassSheetsMapping
+        @rows dbo.ClassSheetsMappingTVP READONLY
+    AS
+    BEGIN
+        SET NOCOUNT ON;
+    """ + MERGE_SQL_TEMPLATE.format(source="@rows") + """
+    END
+    """
+
+def _merge_stats(results, start_time: float) -> dict:
+    """Summarize OUTPUT $action rows returned by the MERGE"""
+    return {
+        'INSERT': sum(1 for r in results if r.Action == 'INSERT'),
+        'UPDATE': sum(1 for r in results if r.Action == 'UPDATE'),
+        'total': len(results),
+        'elapsed_seconds': round(time.time() - start_time, 2)
+    }
+
+def _log_merge_stats(stats: dict):
+    logger.log_operation(
+        'merge_operation',
+        'success',
+        **stats
+    )
+    
+    logger.info(
+        f"✓ MERGE completed: {stats['INSERT']} inserted, "
+        f"{stats['UPDATE']} updated, {stats['total']} total rows affected"
+    )
+
+def _df_to_rows(df: pd.DataFrame) -> List[tuple]:
+    """Convert DataFrame to a list of row tuples with NULLs as None for pyodbc"""
+    return list(
+        df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    )
+
+def merge_data(cursor) -> dict:
+    """
+    Merge data from staging to target table
+    Returns statistics about the operation
+    """
+    logger.info("Starting MERGE operation...")
+    
+    # MERGE and staging cleanup go to the server as one batch (one round-trip)
+    merge_sql = MERGE_SQL_TEMPLATE.format(source=STAGING_TABLE) + f"""
+    DROP TABLE {STAGING_TABLE};
+    """
     
     def _merge():
         start_time = time.time()
@@ -476,40 +936,63 @@ def merge_data(cursor) -> dict:
         
         # Get operation statistics
         results = cursor.fetchall()
-        stats = {
-            'INSERT': sum(1 for r in results if r.Action == 'INSERT'),
-            'UPDATE': sum(1 for r in results if r.Action == 'UPDATE'),
-            'total': len(results),
-            'elapsed_seconds': round(time.time() - start_time, 2)
-        }
         
-        return stats
+        # Drain the remaining statement results so errors in the DROP surface here
+        while cursor.nextset():
+            pass
+        
+        return _merge_stats(results, start_time)
     
     stats = execute_with_retry(_merge, "merge_data")
+    _log_merge_stats(stats)
     
-    logger.log_operation(
-        'merge_operation',
-        'success',
-        **stats
-    )
+    return stats
+
+def create_tvp_objects(cursor):
+    """Create (or refresh) the table type and stored procedure used by the TVP upsert"""
+    logger.info("Creating TVP type and upsert procedure...")
     
-    logger.info(
-        f"✓ MERGE completed: {stats['INSERT']} inserted, "
-        f"{stats['UPDATE']} updated, {stats['total']} total rows affected"
-    )
+    def _create():
+        cursor.execute(CREATE_TVP_TYPE_SQL)
+        cursor.execute(CREATE_TVP_PROC_SQL)
+        logger.info("✓ TVP objects ready")
+    
+    execute_with_retry(_create, "create_tvp_objects")
+
+def upsert_via_tvp(cursor, df: pd.DataFrame) -> dict:
+    """
+    Send the whole frame as one Table-Valued Parameter to the upsert procedure,
+    replacing the staging table, batched inserts and MERGE with a single RPC
+    Returns statistics about the operation
+    """
+    logger.info(f"Starting TVP upsert of {len(df)} records...")
+    
+    rows = _df_to_rows(df)
+    
+    def _upsert():
+        start_time = time.time()
+        cursor.execute("{CALL dbo.UpsertClassSheetsMapping(?)}", (rows,))
+        return _merge_stats(cursor.fetchall(), start_time)
+    
+    stats = execute_with_retry(_upsert, "upsert_via_tvp")
+    _log_merge_stats(stats)
     
     return stats
 
 # -----------------------------------
 # 10. Main Orchestration with Enhanced Error Handling
 # -----------------------------------
-def main(csv_path: str = CSV_PATH, dry_run: bool = False):
+def main(csv_path: str = CSV_PATH, dry_run: bool = False, load_method: str = LOAD_METHOD,
+         workers: int = INSERT_WORKERS):
     """
     Main execution function
     
     Args:
         csv_path: Path to CSV file
         dry_run: If True, perform all steps except final commit
+        load_method: 'bulkcopy' (SqlBulkCopy), 'executemany' (batched INSERTs)
+            or 'tvp' (single Table-Valued Parameter call to a stored procedure)
+        workers: Parallel connections for the executemany load method
     """
     execution_start = time.time()
     
@@ -524,25 +1007,67 @@ def main(csv_path: str = CSV_PATH, dry_run: bool = False):
         # Step 2: Validate file exists
         validate_file_exists(csv_path)
         
-        # Step 3: Load and validate CSV
-        df = load_csv(csv_path)
+        # Step 3: Stream, clean and validate CSV chunk by chunk
+        # (first chunk is read up front so header/encoding errors fail before connecting)
+        chunks = load_csv_iter(csv_path)
+        chunks = itertools.chain([next(chunks)], chunks)
+        total_records = 0
         
         if dry_run:
             logger.info("DRY RUN MODE: Changes will NOT be committed")
         
+        if load_method == "bulkcopy" and bulkcopy_from_pandas is None:
+            logger.warning("arrowsqlbcpy is not installed, falling back to executemany")
+            load_method = "executemany"
+        
         # Step 4: Database operations
         with get_db_connection() as conn:
             cursor = conn.cursor()
             
             try:
-                # Create staging table
-                create_staging_table(cursor)
-                
-                # Bulk insert
-                bulk_insert(cursor, df)
-                
-                # Merge data
-                stats = merge_data(cursor)
+                if load_method == "tvp":
+                    # Single round-trip per chunk: MERGE runs server-side against the TVP
+                    create_tvp_objects(cursor)
+                    stats = {'INSERT': 0, 'UPDATE': 0, 'total': 0, 'elapsed_seconds': 0}
+                    for chunk in chunks:
+                        if chunk.empty:
+                            continue
+                        chunk_stats = upsert_via_tvp(cursor, chunk)
+                        for key in stats:
+                            stats[key] += chunk_stats[key]
+                        total_records += len(chunk)
+                    stats['elapsed_seconds'] = round(stats['elapsed_seconds'], 2)
+                else:
+                    # Create staging table (committed so the bulk copy session can write to it)
+                    create_staging_table(cursor)
+                    conn.commit()
+                    
+                    with ExitStack() as worker_stack:
+                        # Extra sessions for parallel inserts; they all see the global staging table
+                        worker_conns = []
+                        if load_method == "executemany" and workers > 1:
+                            worker_conns = [
+                                worker_stack.enter_context(get_db_connection())
+                                for _ in range(workers)
+                            ]
+                        insert_cursors = [c.cursor() for c in worker_conns] or [cursor]
+                        
+                        # Load staging table as chunks are parsed
+                        for chunk in chunks:
+                            if chunk.empty:
+                                continue
+                            if load_method == "bulkcopy":
+                                bulk_copy(chunk)
+                            else:
+                                bulk_insert(insert_cursors, chunk)
+                            total_records += len(chunk)
+                        
+                        # Make worker inserts visible to the MERGE session
+                        for worker_conn in worker_conns:
+                            worker_conn.commit()
+                    
+                    # Merge data
+                    stats = merge_data(cursor)
                 
                 if dry_run:
                     logger.info("DRY RUN: Rolling back all changes...")
@@ -561,10 +1086,11 @@ def main(csv_path: str = CSV_PATH, dry_run: bool = False):
                 logger.log_operation(
                     'bulk_upsert_complete',
                     'success',
-                    total_records_processed=len(df),
+                    total_records_processed=total_records,
                     records_inserted=stats.get('INSERT', 0),
                     records_updated=stats.get('UPDATE', 0),
                     total_execution_time_seconds=round(total_time, 2),
+                    load_method=load_method,
                     dry_run=dry_run
                 )
                 
@@ -611,6 +1137,9 @@ Examples:
   
   # Custom CSV path
   python bulk_upsert_enhanced.py --csv-path "C:\\custom\\path\\data.csv"
+  
+  # Batched INSERTs instead of SqlBulkCopy
+  python bulk_upsert_enhanced.py --load-method executemany
         """
     )
     
@@ -634,6 +1163,20 @@ Examples:
         help=f'Batch size for bulk insert (default: {BATCH_SIZE})'
     )
     
+    parser.add_argument(
+        '--load-method',
+        choices=LOAD_METHODS,
+        default=LOAD_METHOD,
+        help=f'How rows are loaded into the staging table (default: {LOAD_METHOD})'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=INSERT_WORKERS,
+        help=f'Parallel connections for --load-method executemany (default: {INSERT_WORKERS})'
+    )
+    
     return parser.parse_args()
 
 # -----------------------------------
@@ -648,7 +1191,12 @@ if __name__ == "__main__":
         logger.info(f"Using custom batch size: {BATCH_SIZE}")
     
     try:
-        main(csv_path=args.csv_path, dry_run=args.dry_run)
+        main(
+            csv_path=args.csv_path,
+            dry_run=args.dry_run,
+            load_method=args.load_method,
+            workers=args.workers
+        )
         exit(0)
     except Exception as e:
         logger.error(f"Fatal error: {e}")